@@ -1,35 +1,48 @@
 def extract_text_and_tables(response):
     """Extract text and tables from Textract response"""
+    # Get all blocks
+    blocks = response['Blocks']
+    
+    # Collect text lines, index blocks by id and find all tables in a single pass
+    lines = []
+    block_map = {}
+    table_blocks = []
+    for block in blocks:
+        block_map[block['Id']] = block
+        block_type = block['BlockType']
+        if block_type == 'LINE':
+            lines.append(block['Text'])
+        elif block_type == 'TABLE':
+            table_blocks.append(block)
+    
     # Extract raw text
-    raw_text = ""
-    for item in response['Blocks']:
-        if item['BlockType'] == 'LINE':
-            raw_text += item['Text'] + "\n"
+    raw_text = "\n".join(lines) + "\n" if lines else ""
     
     # Extract tables
     tables = []
     
-    # Get all blocks
-    blocks = response['Blocks']
-    
-    # Find all tables
-    table_blocks = [block for block in blocks if block['BlockType'] == 'TABLE']
-    
     for table_block in table_blocks:
-        table_id = table_block['Id']
-        
-        # Find all cells in this table
-        cell_blocks = [block for block in blocks if 
-                      block['BlockType'] == 'CELL' and 
-                      'EntityTypes' not in block and
-                      block.get('TableId') == table_id]
-        
-        # Get the dimensions of the table
-        max_row = max([cell['RowIndex'] for cell in cell_blocks]) if cell_blocks else 0
-        max_col = max([cell['ColumnIndex'] for cell in cell_blocks]) if cell_blocks else 0
+        # Find all cells in this table through its CHILD relationships,
+        # tracking the table dimensions as we go
+        cell_blocks = []
+        max_row = 0
+        max_col = 0
+        for relationship in table_block.get('Relationships', []):
+            if relationship['Type'] == 'CHILD':
+                for child_id in relationship['Ids']:
+                    child = block_map.get(child_id)
+                    if (child is not None and
+                            child['BlockType'] == 'CELL' and
+                            'EntityTypes' not in child):
+                        cell_blocks.append(child)
+                        if child['RowIndex'] > max_row:
+                            max_row = child['RowIndex']
+                        if child['ColumnIndex'] > max_col:
+                            max_col = child['ColumnIndex']
         
-        # Initialize table as 2D list filled with None
-        table = [[None for _ in range(max_col + 1)] for _ in range(max_row + 1)]
+        # Initialize table as a flat row-major list filled with None
+        width = max_col + 1
+        table = [None] * ((max_row + 1) * width)
         
         # Fill in table with cell data
         for cell in cell_blocks:
@@ -37,18 +50,16 @@ def extract_text_and_tables(response):
             col_idx = cell['ColumnIndex'] - 1  # Convert to 0-indexed
             
             # Find all word blocks for this cell
-            cell_content = ""
-            for relationship in cell.get('Relationships', []):
-                if relationship['Type'] == 'CHILD':
-                    child_ids = relationship['Ids']
-                    word_blocks = [block for block in blocks if 
-                                  block['Id'] in child_ids and
-                                  block['BlockType'] in ['WORD', 'LINE']]
-                    
-                    for word_block in word_blocks:
-                        if cell_content:
-                            cell_content += " "
-                        cell_content += word_block['Text']
+            child_ids = [child_id
+                         for relationship in cell.get('Relationships', [])
+                         if relationship['Type'] == 'CHILD'
+                         for child_id in relationship['Ids']]
+            words = []
+            for child_id in child_ids:
+                word_block = block_map.get(child_id)
+                if word_block is not None and word_block['BlockType'] in ('WORD', 'LINE'):
+                    words.append(word_block['Text'])
+            cell_content = " ".join(words)
             
             # Set cell content in table
             if cell_content:
@@ -62,13 +73,13 @@ def extract_text_and_tables(response):
                     except ValueError:
                         pass
                 
-            table[row_idx][col_idx] = cell_content
+            table[row_idx * width + col_idx] = cell_content
         
-        tables.append(table)
+        tables.append((table, width))
     
     # Combine all tables into a single 2D list
     combined_table = []
-    for table in tables:
-        combined_table.extend(table)
+    for table, width in tables:
+        combined_table.extend(table[start:start + width] for start in range(0, len(table), width))
     
     return raw_text, combined_table
@@ -52,5 +52,33 @@ class TestTextractHelper(unittest.TestCase):
             if os.path.exists(test_file):
                 os.remove(test_file)
 
+    def test_extract_text_and_tables(self):
+        response = {
+            'Blocks': [
+                {'BlockType': 'LINE', 'Text': 'Cylinder Log', 'Id': 'l1'},
+                {'BlockType': 'TABLE', 'Id': 't1',
+                 'Relationships': [{'Type': 'CHILD', 'Ids': ['c1', 'c2', 'c3', 'c4']}]},
+                {'BlockType': 'CELL', 'Id': 'c1', 'RowIndex': 1, 'ColumnIndex': 1,
+                 'Relationships': [{'Type': 'CHILD', 'Ids': ['w1', 'w2']}]},
+                {'BlockType': 'CELL', 'Id': 'c2', 'RowIndex': 1, 'ColumnIndex': 2,
+                 'Relationships': [{'Type': 'CHILD', 'Ids': ['w3']}]},
+                {'BlockType': 'CELL', 'Id': 'c3', 'RowIndex': 2, 'ColumnIndex': 1,
+                 'Relationships': [{'Type': 'CHILD', 'Ids': ['w4']}]},
+                {'BlockType': 'CELL', 'Id': 'c4', 'RowIndex': 2, 'ColumnIndex': 2,
+                 'Relationships': [{'Type': 'CHILD', 'Ids': ['w5']}]},
+                {'BlockType': 'WORD', 'Text': 'Opening', 'Id': 'w1'},
+                {'BlockType': 'WORD', 'Text': 'Stock', 'Id': 'w2'},
+                {'BlockType': 'WORD', 'Text': 'Empty', 'Id': 'w3'},
+                {'BlockType': 'WORD', 'Text': '12', 'Id': 'w4'},
+                {'BlockType': 'WORD', 'Text': '4.5', 'Id': 'w5'},
+            ]
+        }
+        
+        raw_text, table_data = textract_helper.extract_text_and_tables(response)
+        
+        self.assertEqual(raw_text, 'Cylinder Log\n')
+        self.assertEqual(table_data[0][:2], ['Opening Stock', 'Empty'])
+        self.assertEqual(table_data[1][:2], [12, 4.5])
+
 if __name__ == '__main__':
     unittest.main()